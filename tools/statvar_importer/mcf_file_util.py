@@ -175,11 +175,12 @@ def get_pv_from_line(line: str) -> (str, str):
     removing leading/trailing whitespaces from the propety and value.
     quoted values will have the quote preserved.
     In case of a missing ':', the line is returned as value with empty property.
+    The property is interned as property names repeat across nodes.
   """
     pos = line.find(':')
     if pos < 0:
         return ('', line)
-    prop = line[:pos].strip()
+    prop = sys.intern(line[:pos].strip())
     value = line[pos + 1:].strip()
     return (prop, value)
 
@@ -422,14 +423,60 @@ def load_mcf_nodes(
   """
     if not filenames:
         return nodes
+    if nodes is None:
+        nodes = _get_new_node(normalize)
+    for pvs in _load_mcf_pvs(filenames, strip_namespaces, append_values,
+                             normalize):
+        add_mcf_node(pvs, nodes, strip_namespaces, append_values, normalize)
+    return nodes
+
+
+def load_mcf_nodes_iter(
+    filenames: Union[str, list],
+    strip_namespaces: bool = False,
+    append_values: bool = True,
+    normalize: bool = True,
+):
+    """Yields a tuple of (dcid, node) for each node in the MCF files.
+
+  Nodes are read one at a time without loading all nodes in memory.
+  Unlike load_mcf_nodes(), nodes with the same dcid are not merged
+  and are returned separately in the order they appear in the files.
+
+  Args:
+    filenames: command seperated string or a list of MCF filenames
+    strip_namespace: if True, strips namespace from the value for node
+      properties as well as the dcid.
+    append_values: if True, appends repeated values for a property into a
+      comma seperated list, else replaces existing value.
+    normalize: if True, values are normalized.
+
+  Yields:
+    tuple of (dcid, node) where node is a dict of property:values.
+  """
+    for pvs in _load_mcf_pvs(filenames, strip_namespaces, append_values,
+                             normalize):
+        nodes = add_mcf_node(pvs, {}, strip_namespaces, append_values,
+                             normalize)
+        if nodes:
+            yield from nodes.items()
+
+
+def _load_mcf_pvs(
+    filenames: Union[str, list],
+    strip_namespaces: bool = False,
+    append_values: bool = True,
+    normalize: bool = True,
+):
+    """Yields a dict of property:values for each node in the MCF files."""
+    if not filenames:
+        return
     # Load files in order of input
     files = []
     if isinstance(filenames, str):
         filenames = filenames.split(',')
     for file in filenames:
         files.extend(file_util.file_get_matching(file))
-    if nodes is None:
-        nodes = _get_new_node(normalize)
     for file in files:
         if not file:
             continue
@@ -442,8 +489,7 @@ def load_mcf_nodes(
                 if 'Node' not in pvs:
                     pvs['Node'] = key
                 num_props += len(pvs)
-                add_mcf_node(pvs, nodes, strip_namespaces, append_values,
-                             normalize)
+                yield pvs
             num_nodes = len(file_nodes)
         else:
             # Load nodes from MCF file.
@@ -462,8 +508,7 @@ def load_mcf_nodes(
                         line = line.replace('""', '"')
                     if line == '':
                         if pvs:
-                            add_mcf_node(pvs, nodes, strip_namespaces,
-                                         append_values, normalize)
+                            yield pvs
                             num_nodes += 1
                             pvs = _get_new_node(normalize)
                     elif line[0] == '#':
@@ -476,13 +521,11 @@ def load_mcf_nodes(
                                        strip_namespace, normalize)
                         num_props += 1
                 if pvs:
-                    add_mcf_node(pvs, nodes, strip_namespaces, append_values,
-                                 normalize)
+                    yield pvs
                     num_nodes += 1
         logging.info(
             f'Loaded {num_nodes} nodes with {num_props} properties from file {file}'
         )
-    return nodes
 
 
 def filter_mcf_nodes(
@@ -155,6 +155,33 @@ class TestMCFFileUtil(unittest.TestCase):
                                       {dcid: mcf_nodes[dcid]})
             self.assertEqual(diff_str, '')
 
+    def test_load_mcf_nodes_iter(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mcf_file = os.path.join(tmp_dir, 'nodes.mcf')
+            with open(mcf_file, 'w') as f:
+                f.write('Node: Node1\ntypeOf: Class\n\n'
+                        'Node: Node2\nname: "Node 2"\n\n'
+                        'Node: Node1\nname: "Node 1"\n')
+            # Nodes with the same dcid are returned separately.
+            self.assertEqual([('dcid:Node1', {
+                'Node': 'Node1',
+                'typeOf': 'Class'
+            }), ('dcid:Node2', {
+                'Node': 'Node2',
+                'name': '"Node 2"'
+            }), ('dcid:Node1', {
+                'Node': 'Node1',
+                'name': '"Node 1"'
+            })], list(mcf_file_util.load_mcf_nodes_iter(mcf_file)))
+            # Nodes are merged by load_mcf_nodes.
+            self.assertEqual(
+                {
+                    'Node': 'Node1',
+                    'typeOf': 'Class',
+                    'name': '"Node 1"'
+                },
+                mcf_file_util.load_mcf_nodes(mcf_file)['dcid:Node1'])
+
     def test_get_numeric_value(self):
         self.assertEqual(2010, mcf_file_util.get_numeric_value('2010'))
         self.assertEqual(2020, mcf_file_util.get_numeric_value('2020.0'))
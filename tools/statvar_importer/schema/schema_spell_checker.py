@@ -19,6 +19,10 @@ To spell check a list of MCF files, run the command:
       --spell_error_output=<output-file-with-errors-per-node>
 """
 
+import functools
+import hashlib
+import json
+import multiprocessing
 import os
 import re
 import sys
@@ -27,16 +31,21 @@ from absl import app
 from absl import flags
 from absl import logging
 
+import spellchecker
 from spellchecker import SpellChecker
 
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-logging.info(f'DELETE ME: file: {__file__}, dir: {_SCRIPT_DIR}')
-sys.path.append(_SCRIPT_DIR)
-sys.path.append(os.path.dirname(_SCRIPT_DIR))
-sys.path.append(os.path.dirname(os.path.dirname(_SCRIPT_DIR)))
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(_SCRIPT_DIR))),
-                 'util'))
+# Add paths for imported modules once, even if this module is reloaded.
+for _path in [
+        _SCRIPT_DIR,
+        os.path.dirname(_SCRIPT_DIR),
+        os.path.dirname(os.path.dirname(_SCRIPT_DIR)),
+        os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(_SCRIPT_DIR))),
+            'util'),
+]:
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 _DEFAULT_ALLOWLIST = os.path.join(_SCRIPT_DIR, 'words_allowlist.txt')
 
@@ -58,13 +67,13 @@ import process_http_server
 import property_value_utils as pv_utils
 
 from config_map import ConfigMap
-from counters import Counters
+from counters import Counters, CounterOptions
 from config_map import ConfigMap
-from mcf_file_util import load_mcf_nodes, write_mcf_nodes
+from mcf_file_util import load_mcf_nodes_iter, write_mcf_nodes
 from mcf_file_util import add_namespace, strip_namespace, add_mcf_node
 
 # properties ignored for spell check
-_DEFAULT_IGNORE_SPELL_PROPS = {
+_DEFAULT_IGNORE_SPELL_PROPS = frozenset({
     # Ignore non-English property:values
     'nameWithLanguage',
 
@@ -84,7 +93,22 @@ _DEFAULT_IGNORE_SPELL_PROPS = {
 
     # Ignore properties with non-text values
     'keyString',
-}
+})
+
+# Pattern for values ignored for spell check with the first group for ids
+# with 'dc/' followed by auto generated node ids, such as, E0/45f0043e-5a3c.
+_IGNORE_VALUE_RE = re.compile(r'(dc/)|\bE[0-9]+\b')
+# Pattern for auto generated node ids alone.
+_NODE_ID_RE = re.compile(r'\bE[0-9]+\b')
+
+# Pattern for words in a CamelCase or snake_case string.
+# The all caps alternative consumes a run of capitals in one match,
+# else [A-Z]*[a-z]+ backtracks over it from every position.
+# Note: RE2 was slower than re for this pattern on property:values.
+_WORD_RE = re.compile(r'[A-Z]*[a-z]+|[A-Z]+')
+
+# Maximum number of strings for which words and ignore checks are cached.
+_MAX_CACHE_SIZE = 100000
 
 
 def get_words(value: str) -> list:
@@ -96,27 +120,84 @@ def get_words(value: str) -> list:
   Returns:
     List of words
   """
-    # Remove any extra characters
-    value_str = re.sub('[^A-Za-z]', ' ', str(value))
-    words = []
-    for w in value_str.split(' '):
-        if not w:
-            continue
+    # Words are runs of lower case letters with any leading capitals.
+    # Single letters, all caps acronyms and words starting with an acronym
+    # are ignored.
+    return [
+        word for word in _WORD_RE.findall(str(value))
+        if len(word) > 1 and word[1].islower()
+    ]
+
+
+@functools.lru_cache(maxsize=_MAX_CACHE_SIZE)
+def _get_cached_words(value: str) -> tuple:
+    """Returns a tuple of words from the value string.
+
+  Words are cached as property names and values repeat across nodes.
+  """
+    return tuple(get_words(value))
+
+
+@functools.lru_cache(maxsize=_MAX_CACHE_SIZE)
+def _should_ignore_value(value: str) -> bool:
+    """Returns True if the value string should be ignored for spell check."""
+    if '@' in value:
+        # Ignore values with non-English strings like nameWithLanguage
+        return True
+
+    # Scan the value for the first of the remaining patterns to be ignored.
+    match = _IGNORE_VALUE_RE.search(value)
+    if not match:
+        return False
+    if not match.group(1):
+        # Ignore values that are auto generated  Node values,
+        # such as, E0/45f0043e-5a3c-1c95-ee38-79891bfe7b6f
+        return True
+    # Ignore autogenerated ids that begins with dc/, such as,
+    # dc/vp8cbt6k79t94 or dc/o/wjtdrd9wq4m2g
+    # that don't have any capital letters.
+    # Do not ignore human-generated ids such as dc/g/Root
+    if not any(c.isupper() for c in value):
+        return True
+    # Capitals are checked once, so only look for node ids in the rest.
+    return _NODE_ID_RE.search(value, match.end()) is not None
 
-        # Split CamelCase into separate words
-        split_pos = [0]
-        split_pos.extend(
-            [m.start() + 1 for m in re.finditer('[^A-Z][A-Z0-9]', w)])
-        split_pos.append(len(w))
-        words.extend(
-            [w[start:end] for start, end in zip(split_pos, split_pos[1:])])
 
-    # Remove acronyms that are fully capitalized
-    text_words = []
-    for w in words:
-        if len(w) >= 2 and not (w[0].isupper() and w[1].isupper()):
-            text_words.append(w)
-    return text_words
+def _is_known_word(word: str, spell_checker: SpellChecker) -> bool:
+    """Returns True if the lowercase word is in the spell_checker dictionary.
+
+  This is a direct lookup in the dictionary of the SpellChecker without
+  the per call list and set used by SpellChecker.unknown().
+  """
+    return word in spell_checker.word_frequency.dictionary
+
+
+def _is_too_long_to_check(value: str, spell_checker: SpellChecker) -> bool:
+    """Returns True if the value is longer than words checked by the spell_checker.
+
+  Same as the length check in SpellChecker.unknown() that skips strings
+  longer than the longest word in the dictionary with up to 3 more letters.
+  """
+    return len(value) > spell_checker.word_frequency.longest_word_length + 3
+
+
+def _is_known_property(prop: str, spell_checker: SpellChecker,
+                       prop_cache: dict) -> bool:
+    """Returns True if the property is a word in the spell_checker dictionary.
+
+  Properties too long to be a word are not checked and treated as known.
+  The prop_cache is looked up first and updated with new properties.
+  As known words are case insensitive, the property is cached as is.
+  """
+    is_known = prop_cache.get(prop)
+    if is_known is None:
+        is_known = (_is_too_long_to_check(prop, spell_checker) or
+                    _is_known_word(prop.lower(), spell_checker))
+        if len(prop_cache) >= _MAX_CACHE_SIZE:
+            # Remove the oldest property from the cache.
+            del prop_cache[next(iter(prop_cache))]
+        prop_cache[prop] = is_known
+    return is_known
 
 
 def should_ignore_spell_pv(prop: str,
@@ -127,7 +208,8 @@ def should_ignore_spell_pv(prop: str,
 
   Args:
     prop: property string
-    value: value of the property
+    value: value of the property as a string.
+      Values of other types are only checked for the property.
     config: config map with settings:
       'spell_check_props': [] # list of properties to be checked.
       'spell_check_ignore_props': [] # list of properties to be ignored
@@ -137,7 +219,41 @@ def should_ignore_spell_pv(prop: str,
   """
     if not config:
         config = ConfigMap()
+    return _should_ignore_spell_pv(prop, value, *_get_spell_pv_settings(config))
+
+
+def _get_spell_pv_settings(config: ConfigMap) -> tuple:
+    """Returns a tuple of (ignore_props, spell_props, text_only) from config.
 
+  The settings are looked up once and passed to _should_ignore_spell_pv()
+  for each property:value. The lists of properties are returned as
+  frozensets for lookups.
+  """
+    ignore_props = config.get('spell_check_ignore_props')
+    if ignore_props is None:
+        ignore_props = _DEFAULT_IGNORE_SPELL_PROPS
+    spell_props = config.get('spell_check_props', [])
+    if not spell_props:
+        spell_props = []
+    text_only = config.get('spell_check_text_only', False)
+    return (_get_props_set(ignore_props), _get_props_set(spell_props),
+            text_only)
+
+
+def _get_props_set(props: list) -> frozenset:
+    """Returns a frozenset of properties from a list or comma separated string."""
+    if isinstance(props, str):
+        props = props.split(',')
+    return frozenset(props)
+
+
+def _should_ignore_spell_pv(prop: str, value: str, ignore_props: frozenset,
+                            spell_props: frozenset, text_only: bool) -> bool:
+    """Returns True if the property:value should be ignored.
+
+  Same as should_ignore_spell_pv() with settings from
+  _get_spell_pv_settings().
+  """
     # Ignore property that begins with '#'
     if not prop:
         return True
@@ -145,43 +261,23 @@ def should_ignore_spell_pv(prop: str,
     if prop[0] == '#':
         return True
 
-    if not pv_utils.is_valid_property(prop):
-        return True
-
     # Ignore properties in ignore list.
-    ignore_props = config.get('spell_check_ignore_props')
-    if ignore_props is None:
-        ignore_props = _DEFAULT_IGNORE_SPELL_PROPS
-
     if prop in ignore_props:
         return True
 
     # Ignore properties not listed in props to be checked.
-    spell_props = config.get('spell_check_props', [])
     if spell_props and prop not in spell_props:
         return True
 
-    if value and isinstance(value, str):
-        # Ignore autogenerated ids that begins with dc/, such as,
-        # dc/vp8cbt6k79t94 or dc/o/wjtdrd9wq4m2g
-        # that don't have any capital letters.
-        # Do not ignore human-generated ids such as dc/g/Root
-        if "dc/" in value:
-            capitals = [c for c in value if c.isupper()]
-            if not capitals:
-                return True
+    if not pv_utils.is_valid_property(prop):
+        return True
 
+    if value and type(value) is str:
         # Check if only quoted values are to be checked.
-        if '@' in value:
-            # Ignore values with non-English strings like nameWithLanguage
-            return True
-        quoted_values_only = config.get('spell_check_text_only', False)
-        if quoted_values_only and value[0] != '"':
+        if text_only and value[0] != '"':
             return True
 
-        # Ignore values that are auto generated  Node values,
-        # such as, E0/45f0043e-5a3c-1c95-ee38-79891bfe7b6f
-        if re.search(r'\bE[0-9]+\b', value):
+        if _should_ignore_value(value):
             return True
     return False
 
@@ -190,68 +286,142 @@ def spell_check_pvs(dcid: str,
                     node: dict,
                     spell_checker: SpellChecker,
                     config: ConfigMap = None,
-                    counters: Counters = None) -> dict:
+                    counters: Counters = None,
+                    prop_cache: dict = None,
+                    known_words: frozenset = None,
+                    pv_settings: tuple = None) -> dict:
     """Spell check a node with property:values.
 
   Args:
     dcid: dcid for the MCF node.
-    node: dictionary with property:value
+    node: dictionary with property:value.
+      Properties of nodes loaded from MCF files are interned strings,
+      so lookups of the property in sets of properties are faster.
     spell_checker: SpellChecker object
+    prop_cache: dictionary of property to True if the property is a word
+      known to the spell_checker. Updated with new properties checked.
+    known_words: frozenset of lowercase words in the spell_checker dictionary
+      to check words with a set difference. If not set, each word is looked
+      up in the spell_checker.
+    pv_settings: tuple of settings from _get_spell_pv_settings().
+      If not set, the settings are looked up in the config.
 
   Returns:
     Tuple of (misspelled_pvs, misspelled words), where
-      misspelled_pvs is comma separated list of misspelled words per property
-      and misspelled_words is a list of words with spell errors.
+      misspelled_pvs is a dictionary of the set of misspelled words per property
+      and misspelled_words is a set of words with spell errors.
 
   """
-    words_misspelled = set()
-    misspelled_pvs = dict()
+    # Collect lowercase words for each property:value in the node
+    # so that the words across the node are spell checked together.
+    if prop_cache is None:
+        prop_cache = {}
+    if not config:
+        config = ConfigMap()
+    if pv_settings is None:
+        pv_settings = _get_spell_pv_settings(config)
+    ignore_props, spell_props, text_only = pv_settings
+    all_words_per_prop = {}
     for prop, value in node.items():
-        if should_ignore_spell_pv(prop, value, config):
+        value = str(value)
+        if _should_ignore_spell_pv(prop, value, ignore_props, spell_props,
+                                   text_only):
             if counters:
                 counters.add_counter(f'spell-check-ignored-pvs', 1)
             continue
         # Get words from property and value
         pv_words = set()
-        if not config.get('spell_check_text_only', False):
-            if spell_checker.unknown([prop]):
+        if not text_only:
+            # Property names repeat across nodes and are looked up in the
+            # prop_cache before the dictionary.
+            if not _is_known_property(prop, spell_checker, prop_cache):
                 # Prop not in allow list. Check all words property.
-                pv_words = set(get_words(prop))
-        value = str(value)
-        if spell_checker.unknown([value]):
+                pv_words = set(_get_cached_words(prop))
+        if not (_is_too_long_to_check(value, spell_checker) or
+                _is_known_word(value.lower(), spell_checker)):
             # Value not in allow list. Check all words in value.
-            pv_words.update(get_words(strip_namespace(value)))
-        # Spell check all words in this property:value
+            pv_words.update(_get_cached_words(strip_namespace(value)))
         if pv_words:
-            error_words = spell_checker.unknown(pv_words)
+            all_words_per_prop[prop] = {word.lower() for word in pv_words}
+
+    # Spell check the unique words in the node once.
+    all_words = set().union(*all_words_per_prop.values())
+    if known_words is not None:
+        words_misspelled = all_words.difference(known_words)
+    else:
+        words_misspelled = {
+            word for word in all_words
+            if not _is_known_word(word, spell_checker)
+        }
+
+    misspelled_pvs = dict()
+    for prop, pv_words in all_words_per_prop.items():
+        error_words = pv_words & words_misspelled
+        if error_words:
+            #TODO: treat words with spell_checker.candidates()
+            # alone as errors to reduce false positives.
+            logging.error('SpellError: %s:%s:%s', dcid, prop, error_words)
+            misspelled_pvs[prop] = error_words
+        if counters:
+            counters.add_counter(f'spell-check-pvs', 1)
             if error_words:
-                #TODO: treat words with spell_checker.candidates()
-                # alone as errors to reduce false positives.
-                logging.error(f'SpellError: {dcid}:{prop}:{error_words}')
-                words_misspelled.update(error_words)
-                misspelled_pvs[prop] = ', '.join(sorted(error_words))
-            if counters:
-                counters.add_counter(f'spell-check-pvs', 1)
-                if error_words:
-                    counters.add_counter(f'spell-check-pvs-errors', 1)
+                counters.add_counter(f'spell-check-pvs-errors', 1)
     return misspelled_pvs, words_misspelled
 
 
 def spell_check_nodes(nodes: dict,
                       config: ConfigMap = None,
                       counters: Counters = None,
-                      spell_checker: SpellChecker = None) -> dict:
+                      spell_checker: SpellChecker = None,
+                      prop_cache: dict = None) -> dict:
     """Spell check property:values in MCF nodes.
 
     Args:
       nodes: dictionary of nodes, each node as dictionary of property:value
+        or an iterable of (dcid, node) tuples, such as from
+        load_mcf_nodes_iter(). Errors for nodes with the same dcid are merged
+        and the node is counted once.
       counters: counters to be updated
       spell_checker: SpellChecker object.
         If not set, a default SpellChecker is used.
-      quoted_values_only: if True, only text within double-quote are checked.
+      prop_cache: dictionary of properties checked with the spell_checker
+        that can be reused across calls with the same spell_checker.
 
     Returns:
-     dictionary of spell errors keyed by dcid.
+     dictionary of spell errors keyed by dcid, with a comma separated
+     list of misspelled words per property.
+    """
+    node_errors = _spell_check_nodes(nodes, config, counters, spell_checker,
+                                     prop_cache)
+    return {
+        dcid: _get_spell_errors_pvs(error_pvs)
+        for dcid, error_pvs in node_errors.items()
+    }
+
+
+def _get_spell_errors_pvs(error_pvs: dict) -> dict:
+    """Returns a dictionary of comma separated misspelled words per property."""
+    return {
+        prop: ', '.join(sorted(errors)) for prop, errors in error_pvs.items()
+    }
+
+
+def _spell_check_nodes(nodes: dict,
+                       config: ConfigMap = None,
+                       counters: Counters = None,
+                       spell_checker: SpellChecker = None,
+                       prop_cache: dict = None,
+                       known_words: frozenset = None,
+                       pv_settings: tuple = None) -> dict:
+    """Spell check property:values in MCF nodes.
+
+    Same as spell_check_nodes() but returns the set of misspelled words per
+    property, which are joined into a string only when output.
+    known_words is the frozenset of words in the spell_checker dictionary.
+    It is only set for the SpellChecker shared in the process, else words
+    are looked up in the spell_checker dictionary.
+    pv_settings from _get_spell_pv_settings() are looked up in the config
+    for the call if not set.
     """
     if counters is None:
         counters = Counters()
@@ -259,33 +429,119 @@ def spell_check_nodes(nodes: dict,
         config = ConfigMap()
     if not spell_checker:
         # Get a default SpellChecker
-        spell_checker = get_spell_checker(config, counters)
+        spell_checker, known_words = _get_spell_checker(config, counters)
+    if prop_cache is None:
+        prop_cache = {}
+    if pv_settings is None:
+        pv_settings = _get_spell_pv_settings(config)
+
+    if isinstance(nodes, dict):
+        nodes = nodes.items()
 
     node_errors = {}
     error_words = set()
+    # Nodes with the same dcid are counted once as in load_mcf_nodes().
+    dcids = set()
     # Spell check each node.
-    for dcid, node in nodes.items():
-        counters.add_counter('spell-check-nodes', 1)
+    for dcid, node in nodes:
+        if dcid not in dcids:
+            dcids.add(dcid)
+            counters.add_counter('spell-check-nodes', 1)
         misspelled_pvs, misspelled_words = spell_check_pvs(
-            dcid, node, spell_checker, config, counters)
+            dcid, node, spell_checker, config, counters, prop_cache,
+            known_words, pv_settings)
         if misspelled_words:
             # Reccord errors for the node keyed by dcid.
-            logging.error(f'SpellError: {dcid}: {misspelled_pvs}')
-            node_errors[dcid] = misspelled_pvs
+            logging.error('SpellError: %s: %s', dcid, misspelled_pvs)
+            if dcid not in node_errors:
+                counters.add_counter(f'spell-check-nodes-errors', 1, dcid)
+            dcid_errors = node_errors.setdefault(dcid, {})
+            for prop, errors in misspelled_pvs.items():
+                dcid_errors.setdefault(prop, set()).update(errors)
             error_words.update(misspelled_words)
-            counters.add_counter(f'spell-check-nodes-errors', 1, dcid)
     if error_words:
-        logging.error(f'Words with spell errors: {error_words}')
+        logging.error('Words with spell errors: %s', error_words)
         counters.add_counter(f'error-spell-words', len(error_words))
     return node_errors
 
 
+def _spell_check_mcf_file(mcf_file: str,
+                          config: ConfigMap,
+                          counters: Counters,
+                          spell_checker: SpellChecker = None,
+                          prop_cache: dict = None,
+                          known_words: frozenset = None,
+                          pv_settings: tuple = None) -> dict:
+    """Returns a dictionary of spell errors keyed by dcid for an MCF file.
+
+  Nodes are read from the file and spell checked one at a time.
+  """
+    logging.info('Spell checking MCF file: %s', mcf_file)
+    counters.add_counter(f'input-mcf-file', 1, mcf_file)
+    num_nodes = counters.get_counter('spell-check-nodes')
+    node_errors = _spell_check_nodes(load_mcf_nodes_iter(mcf_file), config,
+                                     counters, spell_checker, prop_cache,
+                                     known_words, pv_settings)
+    num_nodes = counters.get_counter('spell-check-nodes') - num_nodes
+    counters.add_counter(f'total', num_nodes)
+    if node_errors:
+        counters.add_counter(f'files-with-spell-errors', 1, mcf_file)
+    counters.add_counter(f'processed', num_nodes)
+    return node_errors
+
+
+# SpellChecker with its known words, allowlist counters and property cache
+# for files spell checked in a worker process.
+_process_spell_checker = None
+_process_known_words = None
+_process_allowlist_counters = {}
+_process_prop_cache = {}
+
+
+def _get_process_counters(counters: Counters) -> dict:
+    """Returns the counters of a worker process to be merged by the parent.
+
+  The start_time and processed counters set for a new Counters are removed.
+  """
+    process_counters = dict(counters.get_counters())
+    process_counters.pop('start_time', None)
+    if not process_counters.get('processed'):
+        process_counters.pop('processed', None)
+    return process_counters
+
+
+def _init_spell_check_process(config_dict: dict):
+    """Loads the SpellChecker once for a worker process."""
+    global _process_spell_checker, _process_known_words
+    global _process_allowlist_counters
+    counters = Counters(options=CounterOptions(show_every_n_sec=0))
+    _process_spell_checker, _process_known_words = _get_spell_checker(
+        ConfigMap(config_dict), counters)
+    _process_allowlist_counters = _get_process_counters(counters)
+
+
+def _spell_check_mcf_file_in_process(mcf_file: str,
+                                     config_dict: dict) -> (dict, dict, dict):
+    """Returns a tuple of (node_errors, counters, allowlist counters).
+
+  Called in a worker process initialized with _init_spell_check_process().
+  """
+    counters = Counters(options=CounterOptions(show_every_n_sec=0))
+    node_errors = _spell_check_mcf_file(mcf_file, ConfigMap(config_dict),
+                                        counters, _process_spell_checker,
+                                        _process_prop_cache,
+                                        _process_known_words)
+    return (node_errors, _get_process_counters(counters),
+            _process_allowlist_counters)
+
+
 def spell_check_mcf(input_mcf: str,
                     config: ConfigMap = None,
                     counters: Counters = None) -> dict:
     """Spell checks dictionary of schema nodes.
   Each node is a dict of property: values.
   Sets counters for misspelled words.
+  If config 'parallelism' is more than 1, files are checked in parallel.
 
   Args:
     input_mcf: MCF file with input nodes.
@@ -300,28 +556,51 @@ def spell_check_mcf(input_mcf: str,
 
     logging.info(
         f'Spell check: {input_mcf} with config: {config.get_configs()}')
-    spell_checker = get_spell_checker(config, counters)
 
     # Check spelling of each node in all MCF files.
-    nodes_misspelled = {}
     input_files = file_util.file_get_matching(input_mcf)
-    for mcf_file in input_files:
-        logging.info(f'Loading MCF file: {mcf_file}')
-        nodes = load_mcf_nodes(mcf_file)
-        counters.add_counter(f'input-mcf-file', 1, mcf_file)
-        counters.add_counter(f'total', len(nodes))
-        node_errors = spell_check_nodes(nodes, config, counters, spell_checker)
-        if node_errors:
-            for dcid, error_pvs in node_errors.items():
-                for prop, errors in error_pvs.items():
-                    nodes_misspelled[len(nodes_misspelled)] = {
-                        'file': mcf_file,
-                        'dcid': dcid,
-                        'property': prop,
-                        'spell_errors': errors,
-                    }
-            counters.add_counter(f'files-with-spell-errors', 1, mcf_file)
-        counters.add_counter(f'processed', len(nodes))
+    parallelism = config.get('parallelism', 0)
+    if parallelism > 1 and len(input_files) > 1:
+        logging.info(f'Spell checking {len(input_files)} files with'
+                     f' {parallelism} parallel processes.')
+        if _get_allowlist_cache_file(config):
+            # Save the allowlist cache once for the worker processes to load.
+            _get_spell_checker(config)
+        config_dict = config.get_configs()
+        with multiprocessing.get_context('spawn').Pool(
+                parallelism,
+                initializer=_init_spell_check_process,
+                initargs=(config_dict,)) as pool:
+            file_results = pool.starmap(
+                _spell_check_mcf_file_in_process,
+                [(mcf_file, config_dict) for mcf_file in input_files])
+        file_errors = []
+        for node_errors, file_counters, allowlist_counters in file_results:
+            file_errors.append(node_errors)
+            counters.add_counters(file_counters)
+            # Allowlist counters are the same for all workers.
+            for counter, value in allowlist_counters.items():
+                counters.set_counter(counter, value)
+    else:
+        spell_checker, known_words = _get_spell_checker(config, counters)
+        prop_cache = {}
+        pv_settings = _get_spell_pv_settings(config)
+        file_errors = [
+            _spell_check_mcf_file(mcf_file, config, counters, spell_checker,
+                                  prop_cache, known_words, pv_settings)
+            for mcf_file in input_files
+        ]
+
+    nodes_misspelled = {}
+    for mcf_file, node_errors in zip(input_files, file_errors):
+        for dcid, error_pvs in node_errors.items():
+            for prop, errors in error_pvs.items():
+                nodes_misspelled[len(nodes_misspelled)] = {
+                    'file': mcf_file,
+                    'dcid': dcid,
+                    'property': prop,
+                    'spell_errors': ', '.join(sorted(errors)),
+                }
     output_file = config.get('spell_check_output', '')
     if nodes_misspelled and output_file:
         # Save misspelled words
@@ -334,35 +613,164 @@ def spell_check_mcf(input_mcf: str,
     return nodes_misspelled
 
 
+# SpellChecker loaded in this process keyed by the allowlist files and words
+# with a tuple of (SpellChecker, number of allowed words, allowlist mtimes,
+# frozenset of known words).
+_SPELL_CHECKERS = {}
+
+
 def get_spell_checker(config: ConfigMap = None,
                       counters: Counters = None) -> SpellChecker:
-    """Returns a SpellChecker object."""
-    spell_checker = SpellChecker()
+    """Returns a new SpellChecker with the allowed words.
+
+  The allowed words are loaded once per process and copied into the
+  SpellChecker returned, so the caller can modify it.
+  If config 'spell_allowlist_cache_dir' is set to a directory owned by the
+  user, words from local allowlist files are also cached in a JSON file in
+  that directory, which is reused while it is newer than the allowlist files.
+  """
+    shared_spell_checker, _ = _get_spell_checker(config, counters)
+    spell_checker = SpellChecker(language=None)
+    spell_checker.word_frequency.load_json(
+        shared_spell_checker.word_frequency.dictionary)
+    return spell_checker
+
+
+def _get_spell_checker(config: ConfigMap = None,
+                       counters: Counters = None) -> (SpellChecker, frozenset):
+    """Returns a tuple of (SpellChecker, known words) shared in the process.
+
+  The SpellChecker for the allowlist and the frozenset of lowercase words in
+  its dictionary are reloaded if any of the local allowlist files change.
+  The SpellChecker is only used for lookups and should not be modified.
+  """
     if not config:
         config = ConfigMap(get_default_spell_config())
     allowlist_file = config.get('spell_allowlist', _DEFAULT_ALLOWLIST)
     allow_words = config.get('spell_allow_words', ['dcs', 'dcid'])
-    initial_words = spell_checker.word_frequency.unique_words
+    if isinstance(allow_words, str):
+        allow_words = allow_words.split(',')
+    if not allow_words:
+        allow_words = []
 
     allow_files = file_util.file_get_matching(allowlist_file)
-    for file in allow_files:
-        logging.info(f'Loading allowed words from {file}')
-        spell_checker.word_frequency.load_text_file(file)
-        if counters:
-            counters.add_counter(f'spell-allowlist-file', 1, file)
-
-    if allow_words:
-        if isinstance(allow_words, str):
-            allow_words = allow_words.split(',')
-        spell_checker.word_frequency.load_words(allow_words)
+    key = (tuple(allow_files), tuple(allow_words))
+    mtimes = _get_files_mtime(allow_files)
+    if _SPELL_CHECKERS.get(key, (None, 0, None, None))[2] != mtimes:
+        spell_checker, num_words = _load_spell_checker(
+            allow_files, allow_words, _get_allowlist_cache_file(config))
+        _SPELL_CHECKERS[key] = (spell_checker, num_words, mtimes,
+                                _get_known_words(spell_checker))
+    spell_checker, num_words, _, known_words = _SPELL_CHECKERS[key]
 
-    num_words = spell_checker.word_frequency.unique_words - initial_words
     logging.info(
         f'Spell checker loaded with {num_words} words from {allowlist_file}')
     if counters:
+        for file in allow_files:
+            counters.add_counter(f'spell-allowlist-file', 1, file)
         counters.add_counter(f'spell-allowlist-words', num_words,
                              allowlist_file)
-    return spell_checker
+    return spell_checker, known_words
+
+
+def _get_known_words(spell_checker: SpellChecker) -> frozenset:
+    """Returns a frozenset of lowercase words known to the spell_checker.
+
+  The word frequency dictionary is a Counter, and set operations with it
+  iterate the whole dictionary, so the words are copied into a frozenset
+  to check words with a set difference.
+  """
+    return frozenset(spell_checker.word_frequency.dictionary)
+
+
+def _get_files_mtime(files: list) -> tuple:
+    """Returns a tuple of modification times for local files, 0 for others."""
+    return tuple(
+        os.path.getmtime(file) if file_util.file_is_local(file) else 0
+        for file in files)
+
+
+def _get_allowlist_cache_file(config: ConfigMap) -> str:
+    """Returns the JSON file to cache words from local allowlist files.
+
+  The file in config 'spell_allowlist_cache_dir' is named with a hash of
+  the allowlist files. Returns an empty string if the cache dir is not set
+  or the allowlist files are not local.
+  """
+    cache_dir = config.get('spell_allowlist_cache_dir', '')
+    if not cache_dir:
+        return ''
+    allow_files = file_util.file_get_matching(
+        config.get('spell_allowlist', _DEFAULT_ALLOWLIST))
+    if not allow_files:
+        return ''
+    for file in allow_files:
+        if not file_util.file_is_local(file):
+            return ''
+    files_hash = hashlib.sha256('\n'.join(
+        os.path.abspath(file) for file in allow_files).encode()).hexdigest()
+    return os.path.join(cache_dir, f'spell_allowlist_{files_hash[:16]}.json')
+
+
+def _load_spell_checker(allow_files: list,
+                        allow_words: list,
+                        cache_file: str = '') -> (SpellChecker, int):
+    """Returns a tuple of (SpellChecker, number of allowed words).
+
+  Args:
+    allow_files: list of files with words to be allowed.
+    allow_words: list of words to be allowed.
+    cache_file: JSON file with the dictionary of words loaded from
+      allow_files. Used if it is newer than the allow_files,
+      else it is updated.
+  """
+    cache = {}
+    if cache_file and os.path.exists(cache_file):
+        cache_mtime = os.path.getmtime(cache_file)
+        if all(os.path.getmtime(file) < cache_mtime for file in allow_files):
+            try:
+                with file_util.FileIO(cache_file) as file:
+                    cache = json.load(file)
+            except (OSError, ValueError) as e:
+                # Rebuild the cache from the allowlist files on any error.
+                logging.warning(f'Ignoring allowlist cache {cache_file}: {e}')
+            if not isinstance(cache, dict):
+                cache = {}
+    if (cache.get('files') == allow_files and
+            cache.get('version') == spellchecker.__version__ and
+            isinstance(cache.get('dictionary'), dict) and
+            isinstance(cache.get('num_words'), int)):
+        # Load the dictionary with allowed words from the cache.
+        spell_checker = SpellChecker(language=None)
+        spell_checker.word_frequency.load_json(cache['dictionary'])
+        initial_words = (spell_checker.word_frequency.unique_words -
+                         cache['num_words'])
+    else:
+        spell_checker = SpellChecker()
+        initial_words = spell_checker.word_frequency.unique_words
+        for file in allow_files:
+            logging.info(f'Loading allowed words from {file}')
+            spell_checker.word_frequency.load_text_file(file)
+        if cache_file:
+            num_words = spell_checker.word_frequency.unique_words - initial_words
+            cache = {
+                'files': allow_files,
+                'version': spellchecker.__version__,
+                'num_words': num_words,
+                'dictionary': dict(spell_checker.word_frequency.dictionary),
+            }
+            try:
+                file_util.file_makedirs(cache_file)
+                with file_util.FileIO(cache_file, 'w') as file:
+                    json.dump(cache, file)
+            except OSError as e:
+                logging.warning(
+                    f'Unable to cache allowed words in {cache_file}: {e}')
+
+    if allow_words:
+        spell_checker.word_frequency.load_words(allow_words)
+    num_words = spell_checker.word_frequency.unique_words - initial_words
+    return spell_checker, num_words
 
 
 def get_default_spell_config() -> dict:
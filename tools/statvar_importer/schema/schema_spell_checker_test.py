@@ -13,12 +13,15 @@
 # limitations under the License.
 """Unit tests for property_value_cache.py."""
 
+import json
 import os
 import sys
+import tempfile
 import unittest
 
 from absl import app
 from absl import logging
+import spellchecker
 
 import schema_spell_checker
 
@@ -31,6 +34,7 @@ sys.path.append(
                  'util'))
 
 from config_map import ConfigMap
+from counters import Counters
 
 
 class SchemaSpellCheckerTest(unittest.TestCase):
@@ -43,6 +47,21 @@ class SchemaSpellCheckerTest(unittest.TestCase):
         ]
         self.assertEqual(expected_words, schema_spell_checker.get_words(word))
 
+    def test_should_ignore_value_many_ids(self):
+        # Values with many dc/ ids are checked in linear time.
+        value = 'dc/g/Root,' * 100000
+        self.assertFalse(schema_spell_checker._should_ignore_value(value))
+        self.assertTrue(
+            schema_spell_checker._should_ignore_value(value + 'E0/abc'))
+        self.assertTrue(
+            schema_spell_checker._should_ignore_value('dc/' * 100000))
+
+    def test_get_words_long_acronym(self):
+        # Long runs of capitals are skipped in linear time.
+        value = 'ABCD' * 25000 + ' someWords'
+        self.assertEqual(['some', 'Words'],
+                         schema_spell_checker.get_words(value))
+
     def test_spell_check_nodes(self):
         nodes = {
             'TestNode1': {
@@ -90,3 +109,212 @@ class SchemaSpellCheckerTest(unittest.TestCase):
         }},
                          schema_spell_checker.spell_check_nodes(
                              nodes, ConfigMap({'spell_check_text_only': True})))
+
+    def test_should_ignore_spell_pv(self):
+        self.assertTrue(
+            schema_spell_checker.should_ignore_spell_pv('url', 'http://abc'))
+        self.assertTrue(
+            schema_spell_checker.should_ignore_spell_pv('#comment', 'text'))
+        self.assertFalse(
+            schema_spell_checker.should_ignore_spell_pv('name', '"Some text"'))
+        config = ConfigMap({
+            'spell_check_ignore_props': [],
+            'spell_check_props': ['url', 'name'],
+            'spell_check_text_only': True,
+        })
+        self.assertFalse(
+            schema_spell_checker.should_ignore_spell_pv('url', '"text"',
+                                                        config))
+        self.assertTrue(
+            schema_spell_checker.should_ignore_spell_pv('name', 'dcs:Value',
+                                                        config))
+        self.assertTrue(
+            schema_spell_checker.should_ignore_spell_pv('description', '"text"',
+                                                        config))
+        # Properties as a comma separated string.
+        config = ConfigMap({'spell_check_props': 'url,name'})
+        self.assertFalse(
+            schema_spell_checker.should_ignore_spell_pv('name', 'text', config))
+        self.assertTrue(
+            schema_spell_checker.should_ignore_spell_pv('nam', 'text', config))
+
+    def test_spell_check_long_value(self):
+        # Values longer than any dictionary word are skipped as in
+        # SpellChecker.unknown().
+        description = ('"Count of persons with a bachelors degree or higher'
+                       ' in the populaton aged 25 years or more"')
+        self.assertGreater(len(description), 48)
+        nodes = {'TestNode': {'description': description}}
+        self.assertEqual({}, schema_spell_checker.spell_check_nodes(nodes))
+
+    def test_spell_check_mcf_parallel(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'nodes1.mcf'), 'w') as f:
+                f.write('Node: TestNode1\ntypeOf: schema:Class\n'
+                        'name: "Some mistaek in text"\n\n'
+                        'Node: TestNode2\ntypPropErr: dcs:Value\n')
+            with open(os.path.join(tmp_dir, 'nodes2.mcf'), 'w') as f:
+                f.write('Node: TestNode3\nname: "Favourite colour"\n\n'
+                        'Node: TestNode4\nname: "No errors here"\n')
+            input_mcf = os.path.join(tmp_dir, '*.mcf')
+
+            def _spell_check(parallelism: int) -> (dict, dict):
+                counters = Counters()
+                errors = schema_spell_checker.spell_check_mcf(
+                    input_mcf, ConfigMap({'parallelism': parallelism}),
+                    counters)
+                # Ignore counters for process time and memory.
+                return errors, {
+                    counter: value
+                    for counter, value in counters.get_counters().items()
+                    if not counter.startswith('process') and
+                    counter != 'start_time'
+                }
+
+            errors, counters = _spell_check(0)
+            self.assertEqual(3, len(errors))
+            self.assertEqual(4, counters['spell-check-nodes'])
+            self.assertEqual((errors, counters), _spell_check(2))
+
+    def test_allowlist_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            allow_file = os.path.join(tmp_dir, 'allowlist.txt')
+            with open(allow_file, 'w') as f:
+                f.write('zqxallowed\n')
+            cache_file = os.path.join(tmp_dir, 'cache', 'allowlist.json')
+            os.makedirs(os.path.dirname(cache_file))
+
+            def _write_cache(cache):
+                with open(cache_file, 'w') as f:
+                    if isinstance(cache, str):
+                        f.write(cache)
+                    else:
+                        json.dump(cache, f)
+                # Set the cache newer than the allowlist.
+                os.utime(allow_file, (1000, 1000))
+                os.utime(cache_file, (2000, 2000))
+
+            def _load(expected_cached: bool):
+                spell_checker, num_words = (
+                    schema_spell_checker._load_spell_checker([allow_file], [],
+                                                             cache_file))
+                self.assertEqual(expected_cached, 'zqxcached' in spell_checker)
+                self.assertEqual(not expected_cached, 'the' in spell_checker)
+                self.assertTrue(expected_cached or
+                                'zqxallowed' in spell_checker)
+                self.assertEqual(1, num_words)
+
+            cache = {
+                'files': [allow_file],
+                'version': spellchecker.__version__,
+                'num_words': 1,
+                'dictionary': {
+                    'zqxcached': 1
+                },
+            }
+            # Valid cache is used.
+            _write_cache(cache)
+            _load(True)
+
+            # Cache older than the allowlist is rebuilt.
+            os.utime(allow_file, (3000, 3000))
+            _load(False)
+            with open(cache_file) as f:
+                self.assertIn('zqxallowed', json.load(f)['dictionary'])
+
+            # Cache from another version is ignored.
+            _write_cache(dict(cache, version='0.0'))
+            _load(False)
+
+            # Corrupt caches are ignored.
+            _write_cache('{not json')
+            _load(False)
+            _write_cache(['not', 'a', 'dict'])
+            _load(False)
+            _write_cache(dict(cache, num_words='1'))
+            _load(False)
+
+    def test_allowlist_cache_file(self):
+        config = ConfigMap(
+            {'spell_allowlist': schema_spell_checker._DEFAULT_ALLOWLIST})
+        # Cache is disabled unless a cache dir is set.
+        self.assertEqual('',
+                         schema_spell_checker._get_allowlist_cache_file(config))
+        config.set_config('spell_allowlist_cache_dir', '/tmp/cache')
+        cache_file = schema_spell_checker._get_allowlist_cache_file(config)
+        self.assertTrue(cache_file.startswith('/tmp/cache/'))
+        self.assertTrue(cache_file.endswith('.json'))
+        # Allowlists with the same first file use different caches.
+        config.set_config('spell_allowlist', [
+            schema_spell_checker._DEFAULT_ALLOWLIST,
+            os.path.abspath(__file__)
+        ])
+        self.assertNotEqual(
+            cache_file, schema_spell_checker._get_allowlist_cache_file(config))
+
+    def test_get_spell_checker(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            allow_file = os.path.join(tmp_dir, 'allowlist.txt')
+            with open(allow_file, 'w') as f:
+                f.write('zqxallowed\n')
+            config = ConfigMap({'spell_allowlist': allow_file})
+            spell_checker = schema_spell_checker.get_spell_checker(config)
+            self.assertIn('zqxallowed', spell_checker)
+
+            # SpellCheckers returned can be modified independently.
+            spell_checker.word_frequency.load_words(['zqxadded'])
+            self.assertNotIn('zqxadded',
+                             schema_spell_checker.get_spell_checker(config))
+
+            # Allowlist is reloaded when modified.
+            with open(allow_file, 'w') as f:
+                f.write('zqxupdated\n')
+            os.utime(allow_file, (3000, 3000))
+            spell_checker = schema_spell_checker.get_spell_checker(config)
+            self.assertIn('zqxupdated', spell_checker)
+            self.assertNotIn('zqxallowed', spell_checker)
+
+    def test_spell_check_repeated_nodes(self):
+        # Nodes with the same dcid are merged and counted once.
+        nodes = [
+            ('TestNode1', {
+                'name': '"Some mistaek"'
+            }),
+            ('TestNode2', {
+                'name': '"No errors"'
+            }),
+            ('TestNode1', {
+                'description': '"Another typp"',
+                'name': '"Other errr"'
+            }),
+        ]
+        counters = Counters()
+        self.assertEqual(
+            {'TestNode1': {
+                'name': 'errr, mistaek',
+                'description': 'typp'
+            }}, schema_spell_checker.spell_check_nodes(nodes,
+                                                       counters=counters))
+        self.assertEqual(2, counters.get_counter('spell-check-nodes'))
+        self.assertEqual(1, counters.get_counter('spell-check-nodes-errors'))
+
+    def test_spell_check_with_modified_spell_checker(self):
+        spell_checker = schema_spell_checker.get_spell_checker(ConfigMap())
+        nodes = {'TestNode': {'name': '"Some zqxword"'}}
+        self.assertEqual({'TestNode': {
+            'name': 'zqxword'
+        }},
+                         schema_spell_checker.spell_check_nodes(
+                             nodes, spell_checker=spell_checker))
+        self.assertEqual(
+            ({
+                'name': {'zqxword'}
+            }, {'zqxword'}),
+            schema_spell_checker.spell_check_pvs('TestNode', nodes['TestNode'],
+                                                 spell_checker))
+
+        # Words added to the spell_checker are used in later checks.
+        spell_checker.word_frequency.load_words(['zqxword'])
+        self.assertEqual({},
+                         schema_spell_checker.spell_check_nodes(
+                             nodes, spell_checker=spell_checker))